@@ -4,12 +4,139 @@ Game Categorization Script
 Intelligently assigns multiple categories to games based on titles and game types
 """
 
+import argparse
+import functools
+import hashlib
 import json
 import re
+import sys
+from collections import Counter
+from pathlib import Path
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+GAMES_JSON = Path('assets/data/games.json')
+
+# The only top-level keys the streaming rewrite knows how to write back
+DOCUMENT_KEYS = frozenset(['meta', 'games'])
+
+def check_document_keys(keys):
+    """Refuse documents whose extra top-level keys the rewrite would drop"""
+    extra = sorted(set(keys) - DOCUMENT_KEYS)
+    if extra:
+        raise ValueError(f"{GAMES_JSON} has unsupported top-level keys {extra}; only 'meta' and 'games' are rewritten")
+
+def checked_events(events):
+    """Pass ijson parse events through, checking each top-level key on the way"""
+    for prefix, event, value in events:
+        if prefix == '' and event == 'map_key':
+            check_document_keys([value])
+        yield prefix, event, value
+
+def read_games_document(f):
+    """Return the meta block of an open games.json and an iterator over its games"""
+    if ijson is None:
+        # Without ijson the document is parsed once and both parts taken from it
+        data = json.load(f)
+        check_document_keys(data)
+        return data['meta'], iter(data['games'])
+    meta = next(ijson.items(f, 'meta', use_float=True))
+    f.seek(0)
+    return meta, ijson.items(checked_events(ijson.parse(f, use_float=True)), 'games.item')
+
+def file_digest(path):
+    """BLAKE2b digest of a file's contents, read in chunks"""
+    digest = hashlib.blake2b()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.digest()
+
+def dump_json(obj, level=0):
+    """Serialize obj with 2-space indentation, nested `level` deep in the document"""
+    if orjson is not None:
+        text = orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    else:
+        text = json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+    return text.replace(b'\n', b'\n' + b'  ' * level)
+
+# Keyword buckets, matched as plain substrings of the lowercased title
+BOARD_GAME_WORDS = frozenset(['chess', 'checkers', 'go ', 'backgammon'])
+CONNECT_FOUR_WORDS = frozenset(['connect four', 'connect-four'])
+TIC_TAC_TOE_WORDS = frozenset(['tic', 'tac', 'toe'])
+RACING_WORDS = frozenset(['racing', 'race', 'circuit', 'speed', 'drift'])
+PUZZLE_WORDS = frozenset(['puzzle', 'match', 'tetris', 'blocks', 'crystal', 'gem', 'swap'])
+CARD_GAME_WORDS = frozenset(['poker', 'cards', 'solitaire', 'blackjack'])
+ARCADE_WORDS = frozenset(['blaster', 'asteroid', 'space', 'shooter', 'invader', 'breakout', 'pong'])
+DEFENSE_WORDS = frozenset(['tower', 'defense', 'defend', 'turret'])
+AI_WORDS = frozenset(['ai ', 'algorithm', 'neural', 'matrix', 'nexus', 'quantum'])
+MULTIPLAYER_WORDS = frozenset(['network', 'online', 'multi', 'battle', 'versus', 'pvp'])
+TWO_PLAYER_WORDS = frozenset(['vs ', 'versus', 'battle', 'duel'])
+ADVENTURE_WORDS = frozenset(['quest', 'adventure', 'exploration', 'journey'])
+SIMULATION_WORDS = frozenset(['simulator', 'tycoon', 'management', 'builder'])
+CLASSIC_WORDS = frozenset(['classic', 'retro', 'vintage', 'old school'])
+HEAD_TO_HEAD_WORDS = frozenset(['chess', 'checkers', 'connect four', 'tic tac toe'])
+
+ALL_KEYWORDS = (
+    BOARD_GAME_WORDS | CONNECT_FOUR_WORDS | TIC_TAC_TOE_WORDS | RACING_WORDS
+    | PUZZLE_WORDS | CARD_GAME_WORDS | ARCADE_WORDS | DEFENSE_WORDS | AI_WORDS
+    | MULTIPLAYER_WORDS | TWO_PLAYER_WORDS | ADVENTURE_WORDS | SIMULATION_WORDS
+    | CLASSIC_WORDS | HEAD_TO_HEAD_WORDS
+)
+
+# One alternation over every keyword, wrapped in a lookahead so that matches
+# may overlap (e.g. "tic tac toe" and "tac"). Longest keywords come first.
+KEYWORD_PATTERN = re.compile(
+    '(?=(' + '|'.join(re.escape(word) for word in sorted(ALL_KEYWORDS, key=lambda w: (-len(w), w))) + '))'
+)
+
+# A match only reports the longest keyword at a given position, so also
+# credit any shorter keyword that is a prefix of it.
+KEYWORD_PREFIXES = {
+    word: frozenset(other for other in ALL_KEYWORDS if word.startswith(other))
+    for word in ALL_KEYWORDS
+}
+
+# Aho-Corasick automaton over the same keywords, which reports every
+# (possibly overlapping) hit in one pass; the regex above is the fallback
+if ahocorasick is not None:
+    KEYWORD_AUTOMATON = ahocorasick.Automaton()
+    for word in ALL_KEYWORDS:
+        KEYWORD_AUTOMATON.add_word(word, word)
+    KEYWORD_AUTOMATON.make_automaton()
+else:
+    KEYWORD_AUTOMATON = None
+
+def find_keywords(title_lower):
+    """Return the set of known keywords occurring anywhere in the title"""
+    if KEYWORD_AUTOMATON is not None:
+        return {word for _, word in KEYWORD_AUTOMATON.iter(title_lower)}
+    found = set()
+    for match in KEYWORD_PATTERN.finditer(title_lower):
+        found |= KEYWORD_PREFIXES[match.group(1)]
+    return found
 
 def get_game_categories(title, current_category, genre, description=""):
     """Determine appropriate categories for a game based on its title and properties"""
-    title_lower = title.lower()
+    return list(_categorize_cached(title.lower(), current_category))
+
+@functools.lru_cache(maxsize=4096)
+def _categorize_cached(title_lower, current_category):
+    """Rule engine behind get_game_categories, memoized on its only real inputs"""
+    keywords = find_keywords(title_lower)
     categories = set()
     
     # Always include the current category as a starting point
@@ -17,41 +144,41 @@ def get_game_categories(title, current_category, genre, description=""):
         categories.add(current_category)
     
     # Strategy games (2-player board games)
-    if any(word in title_lower for word in ['chess', 'checkers', 'go ', 'backgammon']):
+    if not keywords.isdisjoint(BOARD_GAME_WORDS):
         categories.update(['strategy', '2-player', 'classic'])
     
     # Connect Four variants
-    if 'connect four' in title_lower or 'connect-four' in title_lower:
+    if not keywords.isdisjoint(CONNECT_FOUR_WORDS):
         categories.update(['puzzle', '2-player', 'strategy'])
         categories.discard('simulation')  # Remove incorrect simulation category
     
     # Tic-tac-toe variants
-    if 'tic' in title_lower and 'tac' in title_lower and 'toe' in title_lower:
+    if TIC_TAC_TOE_WORDS <= keywords:
         categories.update(['puzzle', '2-player', 'classic'])
         categories.discard('simulation')  # Remove incorrect simulation category
     
     # Racing games
-    if any(word in title_lower for word in ['racing', 'race', 'circuit', 'speed', 'drift']):
+    if not keywords.isdisjoint(RACING_WORDS):
         categories.update(['racing', 'arcade'])
     
     # Puzzle games
-    if any(word in title_lower for word in ['puzzle', 'match', 'tetris', 'blocks', 'crystal', 'gem', 'swap']):
+    if not keywords.isdisjoint(PUZZLE_WORDS):
         categories.add('puzzle')
     
     # Card games
-    if any(word in title_lower for word in ['poker', 'cards', 'solitaire', 'blackjack']):
+    if not keywords.isdisjoint(CARD_GAME_WORDS):
         categories.update(['classic', '2-player'])
     
     # Arcade games
-    if any(word in title_lower for word in ['blaster', 'asteroid', 'space', 'shooter', 'invader', 'breakout', 'pong']):
+    if not keywords.isdisjoint(ARCADE_WORDS):
         categories.update(['arcade', 'classic'])
     
     # Tower Defense
-    if any(word in title_lower for word in ['tower', 'defense', 'defend', 'turret']):
+    if not keywords.isdisjoint(DEFENSE_WORDS):
         categories.update(['defense', 'strategy'])
     
     # AI-specific games
-    if any(word in title_lower for word in ['ai ', 'algorithm', 'neural', 'matrix', 'nexus', 'quantum']):
+    if not keywords.isdisjoint(AI_WORDS):
         if 'ai-exclusive' in categories:
             categories.update(['ai-exclusive', 'strategy'])
         else:
@@ -59,88 +186,115 @@ def get_game_categories(title, current_category, genre, description=""):
             categories.add('strategy')
     
     # Multiplayer indicators
-    if any(word in title_lower for word in ['network', 'online', 'multi', 'battle', 'versus', 'pvp']):
+    if not keywords.isdisjoint(MULTIPLAYER_WORDS):
         categories.add('multiplayer')
-        if 'multi' in title_lower:
+        if 'multi' in keywords:
             categories.add('4-player')
     
     # 2-player indicators (but not multiplayer lobby games)
-    if any(word in title_lower for word in ['vs ', 'versus', 'battle', 'duel']) and 'network' not in title_lower:
+    if not keywords.isdisjoint(TWO_PLAYER_WORDS) and 'network' not in keywords:
         categories.add('2-player')
     
     # Adventure/RPG games
-    if any(word in title_lower for word in ['quest', 'adventure', 'exploration', 'journey']):
+    if not keywords.isdisjoint(ADVENTURE_WORDS):
         categories.add('adventure')
     
     # Simulation games
-    if any(word in title_lower for word in ['simulator', 'tycoon', 'management', 'builder']):
+    if not keywords.isdisjoint(SIMULATION_WORDS):
         categories.add('simulation')
     
     # Classic games
-    if any(word in title_lower for word in ['classic', 'retro', 'vintage', 'old school']):
+    if not keywords.isdisjoint(CLASSIC_WORDS):
         categories.add('classic')
     
     # Remove contradictions
     if '2-player' in categories and 'multiplayer' in categories:
         # If it's specifically 2-player, remove generic multiplayer
-        if any(word in title_lower for word in ['chess', 'checkers', 'connect four', 'tic tac toe']):
+        if not keywords.isdisjoint(HEAD_TO_HEAD_WORDS):
             categories.discard('multiplayer')
     
     # Ensure at least one category
     if not categories:
         categories.add('arcade')  # Default fallback
     
-    return sorted(list(categories))
+    return tuple(sorted(categories))
 
-def update_games_with_categories():
+def update_games_with_categories(verbose=False):
     """Update the games.json file with proper multiple categories"""
     
-    # Load current data
-    with open('assets/data/games.json', 'r', encoding='utf-8') as f:
-        data = json.load(f)
-    
     # Update categories metadata
     all_categories = [
         "2-player", "4-player", "ai-exclusive", "adventure", "arcade", 
         "classic", "defense", "multiplayer", "puzzle", "racing", 
         "simulation", "strategy"
     ]
-    data['meta']['categories'] = all_categories
-    
-    print(f"Processing {len(data['games'])} games...")
-    
-    # Update each game
-    for game in data['games']:
-        old_category = game.get('category', 'arcade')
-        new_categories = get_game_categories(
-            game['title'], 
-            old_category, 
-            game.get('genre', ''),
-            game.get('description', '')
-        )
-        
-        # Replace single category with categories array
-        game['categories'] = new_categories
-        # Keep the original category field for backward compatibility initially
-        game['category'] = new_categories[0]  # Primary category
-        
-        print(f"{game['title']:<30} | {old_category:<12} -> {', '.join(new_categories)}")
-    
-    # Save updated data
-    with open('assets/data/games.json', 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
-    
-    print(f"\n✅ Updated {len(data['games'])} games with multiple categories!")
     
-    # Print new category distribution
-    category_counts = {}
-    for game in data['games']:
-        for category in game['categories']:
-            category_counts[category] = category_counts.get(category, 0) + 1
+    print(f"Processing games from {GAMES_JSON}...")
+    
+    # Stream games through one at a time, writing the updated document to a
+    # temporary file that replaces games.json once it is complete
+    tmp_path = GAMES_JSON.with_name(GAMES_JSON.name + '.tmp')
+    log_lines = []
+    game_count = 0
+    category_counts = Counter()
+    # Hash the new document as it is written, for the no-change check below
+    new_digest = hashlib.blake2b()
+    try:
+        with open(GAMES_JSON, 'rb') as in_f, open(tmp_path, 'wb') as out_f:
+            def write(chunk):
+                out_f.write(chunk)
+                new_digest.update(chunk)
+            
+            meta, games = read_games_document(in_f)
+            meta['categories'] = all_categories
+            write(b'{\n  "meta": ' + dump_json(meta, 1) + b',\n  "games": [')
+            
+            # Update each game
+            for game in games:
+                old_category = game.get('category', 'arcade')
+                new_categories = get_game_categories(
+                    game['title'], 
+                    old_category, 
+                    game.get('genre', ''),
+                    game.get('description', '')
+                )
+                
+                # Replace single category with categories array
+                game['categories'] = new_categories
+                # Keep the original category field for backward compatibility initially
+                game['category'] = new_categories[0]  # Primary category
+                
+                write((b',\n    ' if game_count else b'\n    ') + dump_json(game, 2))
+                game_count += 1
+                category_counts.update(new_categories)
+                if verbose:
+                    log_lines.append(f"{game['title']:<30} | {old_category:<12} -> {', '.join(new_categories)}")
+            
+            write(b'\n  ]\n}' if game_count else b']\n}')
+    except BaseException:
+        # Don't leave a half-written file behind in assets/data; it may not
+        # exist yet if games.json itself could not be opened
+        tmp_path.unlink(missing_ok=True)
+        raise
     
+    if log_lines:
+        sys.stdout.write('\n'.join(log_lines) + '\n')
+    
+    # Save updated data, unless nothing changed since the last run
+    if new_digest.digest() == file_digest(GAMES_JSON):
+        tmp_path.unlink()
+        print(f"\n✅ {GAMES_JSON} already up to date for {game_count} games, not rewritten")
+    else:
+        tmp_path.replace(GAMES_JSON)
+        print(f"\n✅ Updated {game_count} games with multiple categories!")
+    
+    # Print new category distribution
     print("\nNew category distribution:")
-    for category in sorted(category_counts.keys()):
-        print(f"  {category}: {category_counts[category]} games")
+    for category, count in sorted(category_counts.items()):
+        print(f"  {category}: {count} games")
 
 if __name__ == "__main__":
-    update_games_with_categories()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Assign multiple categories to every game in games.json")
+    parser.add_argument('-v', '--verbose', action='store_true', help="print the old and new categories of each game")
+    args = parser.parse_args()
+    update_games_with_categories(verbose=args.verbose)
\ No newline at end of file
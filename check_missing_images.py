@@ -3,34 +3,83 @@
 Check for missing game card images by comparing HTML references with actual files.
 """
 
+import argparse
+import functools
+import mmap
 import os
 import re
-import glob
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain
 from pathlib import Path
 
-def extract_image_references(html_file):
+# Image references in assets/images/*-card.jpg, matched on raw bytes
+IMAGE_REF_PREFIX = b'assets/images/'
+IMAGE_REF_SUFFIX = b'-card.jpg'
+IMAGE_REF_PATTERN = re.compile(rb'assets/images/([^"]+?-card\.jpg)')
+
+def find_image_references(content):
+    """Yield the same names as IMAGE_REF_PATTERN, locating them with bytes.find."""
+    pos = content.find(IMAGE_REF_PREFIX)
+    while pos != -1:
+        start = pos + len(IMAGE_REF_PREFIX)
+        # The name is the shortest non-empty, quote-free run ending in the suffix
+        end = content.find(IMAGE_REF_SUFFIX, start + 1)
+        if end == -1:
+            return
+        quote = content.find(b'"', start, end)
+        if quote == -1:
+            end += len(IMAGE_REF_SUFFIX)
+            yield content[start:end]
+            pos = content.find(IMAGE_REF_PREFIX, end)
+        else:
+            pos = content.find(IMAGE_REF_PREFIX, pos + 1)
+
+def extract_image_references(html_file, use_regex=False):
     """Extract all image references from HTML file."""
-    with open(html_file, 'r', encoding='utf-8') as f:
-        content = f.read()
-    
-    # Find all image references in assets/images/*-card.jpg
-    pattern = r'assets/images/([^"]+?-card\.jpg)'
-    matches = re.findall(pattern, content)
+    with open(html_file, 'rb') as f:
+        # mmap cannot map an empty file
+        if os.fstat(f.fileno()).st_size == 0:
+            return []
+        # Scan the page cache directly instead of copying the file into memory
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+            if use_regex:
+                names = (match.group(1) for match in IMAGE_REF_PATTERN.finditer(content))
+            else:
+                names = find_image_references(content)
+            matches = {name.decode('utf-8') for name in names}
     
     # Remove duplicates and sort
-    unique_matches = sorted(set(matches))
-    return unique_matches
+    return sorted(matches)
+
+def collect_image_references(html_files, use_regex=False):
+    """Extract image references from several HTML files, scanning them in parallel."""
+    extract = functools.partial(extract_image_references, use_regex=use_regex)
+    workers = min(len(html_files), os.cpu_count() or 1)
+    
+    # A single worker gains nothing from a process pool, so scan in-process
+    if workers <= 1:
+        return sorted(set(chain.from_iterable(map(extract, html_files))))
+    
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        per_file = pool.map(extract, html_files, chunksize=max(1, len(html_files) // (workers * 4)))
+        return sorted(set(chain.from_iterable(per_file)))
 
 def get_existing_images(images_dir):
-    """Get list of existing image files."""
-    jpg_files = glob.glob(os.path.join(images_dir, "*-card.jpg"))
-    # Extract just the filename without path
-    filenames = [os.path.basename(f) for f in jpg_files]
-    return sorted(filenames)
+    """Get the set of existing image files."""
+    with os.scandir(images_dir) as entries:
+        return {
+            entry.name for entry in entries
+            if entry.name.endswith("-card.jpg") and entry.is_file(follow_symlinks=False)
+        }
 
 def main():
+    parser = argparse.ArgumentParser(description="Check for missing game card images")
+    parser.add_argument("html_files", nargs="*", default=["index.html"], help="HTML pages to scan (default: index.html)")
+    parser.add_argument("--regex", action="store_true", help="match references with the regex instead of the bytes.find scanner")
+    args = parser.parse_args()
+    
     # Paths
-    html_file = "index.html"
+    html_files = args.html_files
     images_dir = "assets/images"
     
     print("Bot Liberation Games - Missing Images Check")
@@ -38,7 +87,7 @@ def main():
     
     # Extract references from HTML
     print("Extracting image references from HTML...")
-    referenced_images = extract_image_references(html_file)
+    referenced_images = collect_image_references(html_files, use_regex=args.regex)
     print(f"Found {len(referenced_images)} unique image references")
     
     # Get existing images
@@ -48,12 +97,8 @@ def main():
     
     # Find missing images
     print("\nChecking for missing images...")
-    missing_images = []
-    existing_set = set(existing_images)
-    
-    for ref_img in referenced_images:
-        if ref_img not in existing_set:
-            missing_images.append(ref_img)
+    referenced_set = set(referenced_images)
+    missing_images = sorted(referenced_set - existing_images)
     
     # Report results
     if missing_images:
@@ -72,8 +117,7 @@ def main():
     
     # Check for unused images
     print(f"\nChecking for unused images...")
-    referenced_set = set(referenced_images)
-    unused_images = [img for img in existing_images if img not in referenced_set]
+    unused_images = sorted(existing_images - referenced_set)
     
     if unused_images:
         print(f"\nUNUSED IMAGES ({len(unused_images)}):")
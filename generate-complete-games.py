@@ -3,108 +3,143 @@
 import json
 import os
 import random
+import re
+from dataclasses import asdict, dataclass
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Get all HTML game files
-games_dir = Path(".")
-game_files = [f for f in games_dir.glob("*.html") if f.name != "index.html"]
+with os.scandir(".") as entries:
+    game_files = sorted(
+        entry.name for entry in entries
+        if entry.name.endswith(".html") and entry.name != "index.html" and entry.is_file()
+    )
 
 # Game categories and details
 categories = ["strategy", "arcade", "puzzle", "ai-exclusive", "multiplayer", "rhythm", "simulation", "adventure", "classic", "defense", "racing"]
 difficulties = ["easy", "medium", "hard", "extreme"]
 badges = ["available", "new-release", "ai-exclusive", "2-player"]
 
+# Games with hand-picked (category, difficulty, badge)
+SPECIAL_GAMES = {
+    "ai-algorithm-optimizer": ("ai-exclusive", "extreme", "ai-exclusive"),
+    "ai-pattern-matrix": ("ai-exclusive", "extreme", "ai-exclusive"),
+    "ai-logic-nexus": ("ai-exclusive", "hard", "ai-exclusive"),
+    "quantum-decision-tree": ("ai-exclusive", "extreme", "ai-exclusive"),
+    "neural-pattern-synthesis": ("ai-exclusive", "extreme", "ai-exclusive"),
+    "neural-network-trainer": ("ai-exclusive", "extreme", "ai-exclusive"),
+    "data-clustering-lab": ("ai-exclusive", "extreme", "ai-exclusive"),
+    "bot-territory-wars": ("multiplayer", "medium", "2-player"),
+    "cyber-chess-network": ("multiplayer", "medium", "2-player"),
+    "digital-territories": ("multiplayer", "hard", "2-player"),
+    "quantum-strategy-wars": ("multiplayer", "hard", "2-player"),
+    "tower-defense-nexus": ("defense", "hard", "new-release"),
+    "cyber-tower-defense": ("defense", "medium", "available"),
+    "bot-defender-turrets": ("defense", "medium", "available"),
+}
+
+# Auto-detect rules for every other game, in priority order:
+# (group name, filename pattern, category choices, difficulty choices)
+AUTO_DETECT_RULES = (
+    ("ai", r"ai-", ("ai-exclusive",), ("hard",)),
+    ("brain", r"neural-|quantum-", ("puzzle",), ("hard",)),
+    ("defense", r"tower|defense|defender", ("defense",), ("medium", "hard")),
+    ("racing", r"racing|racer", ("racing",), ("medium",)),
+    ("classic", r"snake|tetris|pong|invaders", ("classic",), ("easy",)),
+    ("puzzle", r"puzzle|maze|matrix", ("puzzle",), ("medium", "hard")),
+    ("versus", r"battle|duel|arena|wars", ("multiplayer",), ("medium",)),
+    ("memory", r"memory|simon|match", ("puzzle",), ("easy",)),
+)
+FALLBACK_CHOICES = (("arcade", "adventure", "simulation"), ("easy", "medium"))
+
+# One lookahead per rule, tried in order from the start of the name, so the
+# first rule with a hit anywhere in the name wins and names the match group
+AUTO_DETECT_PATTERN = re.compile(
+    "|".join(f"(?=.*?(?P<{group}>{pattern}))" for group, pattern, _, _ in AUTO_DETECT_RULES),
+    re.DOTALL,
+)
+AUTO_DETECT_CHOICES = {
+    group: (category_choices, difficulty_choices)
+    for group, _, category_choices, difficulty_choices in AUTO_DETECT_RULES
+}
+
+# Turns filename separators into spaces in a single pass
+SEPARATORS_TO_SPACES = str.maketrans({"-": " ", "_": " "})
+
+# Description for each category
+DESCRIPTIONS = {
+    "action": "Fast-paced action and adrenaline-pumping gameplay.",
+    "puzzle": "Challenge your mind with strategic thinking and problem-solving.",
+    "arcade": "Classic arcade fun with modern enhancements.",
+    "strategy": "Deep strategic gameplay with tactical decision-making.",
+    "ai-exclusive": "Advanced challenges designed specifically for AI systems.",
+    "multiplayer": "Competitive gameplay for multiple players.",
+    "defense": "Defend your base against waves of enemies.",
+    "racing": "High-speed racing action with stunning visuals.",
+    "classic": "Timeless gameplay with a modern twist.",
+    "rhythm": "Musical gameplay that tests your timing and rhythm.",
+    "simulation": "Realistic simulation with detailed mechanics.",
+    "adventure": "Explore digital worlds and uncover mysteries."
+}
+
+@dataclass(slots=True)
+class GameEntry:
+    """One game record, serialized in field order"""
+    id: str
+    title: str
+    category: str
+    genre: str
+    description: str
+    thumbnail: str
+    rating: float
+    plays: int
+    difficulty: str
+    tags: list
+    release_date: str
+    badge: str
+    file: str
+
 def generate_game_data(filename):
     """Generate game metadata from filename"""
-    name = filename.stem
-    title = name.replace("-", " ").replace("_", " ").title()
-    
-    # Special handling for specific games
-    special_games = {
-        "ai-algorithm-optimizer": {"category": "ai-exclusive", "difficulty": "extreme", "badge": "ai-exclusive"},
-        "ai-pattern-matrix": {"category": "ai-exclusive", "difficulty": "extreme", "badge": "ai-exclusive"},
-        "ai-logic-nexus": {"category": "ai-exclusive", "difficulty": "hard", "badge": "ai-exclusive"},
-        "quantum-decision-tree": {"category": "ai-exclusive", "difficulty": "extreme", "badge": "ai-exclusive"},
-        "neural-pattern-synthesis": {"category": "ai-exclusive", "difficulty": "extreme", "badge": "ai-exclusive"},
-        "neural-network-trainer": {"category": "ai-exclusive", "difficulty": "extreme", "badge": "ai-exclusive"},
-        "data-clustering-lab": {"category": "ai-exclusive", "difficulty": "extreme", "badge": "ai-exclusive"},
-        "bot-territory-wars": {"category": "multiplayer", "difficulty": "medium", "badge": "2-player"},
-        "cyber-chess-network": {"category": "multiplayer", "difficulty": "medium", "badge": "2-player"},
-        "digital-territories": {"category": "multiplayer", "difficulty": "hard", "badge": "2-player"},
-        "quantum-strategy-wars": {"category": "multiplayer", "difficulty": "hard", "badge": "2-player"},
-        "tower-defense-nexus": {"category": "defense", "difficulty": "hard", "badge": "new-release"},
-        "cyber-tower-defense": {"category": "defense", "difficulty": "medium", "badge": "available"},
-        "bot-defender-turrets": {"category": "defense", "difficulty": "medium", "badge": "available"},
-    }
+    name = filename[:-len(".html")]
+    title = name.translate(SEPARATORS_TO_SPACES).title()
+    # Seeded from the name so regenerating gives each game the same values
+    rng = random.Random(name)
     
-    if name in special_games:
-        category = special_games[name]["category"]
-        difficulty = special_games[name]["difficulty"]
-        badge = special_games[name]["badge"]
+    if name in SPECIAL_GAMES:
+        category, difficulty, badge = SPECIAL_GAMES[name]
     else:
         # Auto-detect category from name
-        if "ai-" in name or "neural-" in name or "quantum-" in name:
-            category = "ai-exclusive" if "ai-" in name else "puzzle"
-            difficulty = "hard"
-        elif "tower" in name or "defense" in name or "defender" in name:
-            category = "defense"
-            difficulty = random.choice(["medium", "hard"])
-        elif "racing" in name or "racer" in name or "racing" in name:
-            category = "racing"
-            difficulty = "medium"
-        elif "snake" in name or "tetris" in name or "pong" in name or "invaders" in name:
-            category = "classic"
-            difficulty = "easy"
-        elif "puzzle" in name or "maze" in name or "matrix" in name:
-            category = "puzzle"
-            difficulty = random.choice(["medium", "hard"])
-        elif "battle" in name or "duel" in name or "arena" in name or "wars" in name:
-            category = "multiplayer"
-            difficulty = "medium"
-        elif "memory" in name or "simon" in name or "match" in name:
-            category = "puzzle"
-            difficulty = "easy"
-        else:
-            category = random.choice(["arcade", "adventure", "simulation"])
-            difficulty = random.choice(["easy", "medium"])
+        match = AUTO_DETECT_PATTERN.match(name)
+        category_choices, difficulty_choices = AUTO_DETECT_CHOICES[match.lastgroup] if match else FALLBACK_CHOICES
+        category = rng.choice(category_choices)
+        difficulty = rng.choice(difficulty_choices)
         
         badge = "ai-exclusive" if category == "ai-exclusive" else ("2-player" if category == "multiplayer" else "available")
     
-    # Generate description based on title
-    descriptions = {
-        "action": "Fast-paced action and adrenaline-pumping gameplay.",
-        "puzzle": "Challenge your mind with strategic thinking and problem-solving.",
-        "arcade": "Classic arcade fun with modern enhancements.",
-        "strategy": "Deep strategic gameplay with tactical decision-making.",
-        "ai-exclusive": "Advanced challenges designed specifically for AI systems.",
-        "multiplayer": "Competitive gameplay for multiple players.",
-        "defense": "Defend your base against waves of enemies.",
-        "racing": "High-speed racing action with stunning visuals.",
-        "classic": "Timeless gameplay with a modern twist.",
-        "rhythm": "Musical gameplay that tests your timing and rhythm.",
-        "simulation": "Realistic simulation with detailed mechanics.",
-        "adventure": "Explore digital worlds and uncover mysteries."
-    }
-    
-    return {
-        "id": name,
-        "title": title,
-        "category": category,
-        "genre": title.split()[-1] if len(title.split()) > 1 else "Game",
-        "description": descriptions.get(category, "Engaging gameplay experience."),
-        "thumbnail": f"assets/images/{name}-card.jpg",
-        "rating": round(random.uniform(4.0, 5.0), 1),
-        "plays": random.randint(1000, 15000),
-        "difficulty": difficulty,
-        "tags": [name.split("-")[0], category, difficulty],
-        "release_date": "2024-12-01",
-        "badge": badge,
-        "file": f"{name}.html"
-    }
+    return GameEntry(
+        id=name,
+        title=title,
+        category=category,
+        genre=title.split()[-1] if len(title.split()) > 1 else "Game",
+        description=DESCRIPTIONS.get(category, "Engaging gameplay experience."),
+        thumbnail=f"assets/images/{name}-card.jpg",
+        rating=round(rng.uniform(4.0, 5.0), 1),
+        plays=rng.randint(1000, 15000),
+        difficulty=difficulty,
+        tags=[name.split("-")[0], category, difficulty],
+        release_date="2024-12-01",
+        badge=badge,
+        file=f"{name}.html",
+    )
 
 # Generate complete games list
 games_data = []
-for game_file in sorted(game_files):
+for game_file in game_files:
     games_data.append(generate_game_data(game_file))
 
 # Create complete JSON
@@ -119,10 +154,15 @@ complete_json = {
 }
 
 # Write to file
-with open("assets/data/games.json", "w", encoding="utf-8") as f:
-    json.dump(complete_json, f, indent=2, ensure_ascii=False)
+if orjson is not None:
+    Path("assets/data/games.json").write_bytes(
+        orjson.dumps(complete_json, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    )
+else:
+    with open("assets/data/games.json", "w", encoding="utf-8") as f:
+        json.dump(complete_json, f, indent=2, ensure_ascii=False, default=asdict)
 
 print(f"Generated complete games database with {len(games_data)} games!")
 for game in games_data[:10]:
-    print(f"- {game['title']} ({game['category']}) - {game['difficulty']}")
+    print(f"- {game.title} ({game.category}) - {game.difficulty}")
 print("...")
\ No newline at end of file